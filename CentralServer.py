@@ -1,100 +1,266 @@
 # CentralServer.py
+import re
 import socket
+import selectors
+import struct
 import threading
 import tkinter as tk
 from tkinter import ttk
-import json
 import time
 import datetime
+import queue
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from collections import deque
 
+try:
+    import orjson as _json  # Parses bytes directly, several times faster than stdlib json
+except ImportError:
+    import json as _json
+JSONDecodeError = _json.JSONDecodeError
+
+try:
+    import zstandard  # Needed only when drones send compressed frames
+except ImportError:
+    zstandard = None
+
 CENTRAL_PORT = 6000
+RECV_CHUNK_SIZE = 16384  # Bytes read per recv() on drone connections
+RECV_BUFFER_SIZE = 65536  # Kernel receive buffer (SO_RCVBUF) for drone connections
+MAX_LINE_SIZE = 1 << 20  # Longest newline-delimited message accepted from a drone
 DATA_HISTORY_SIZE = 100  # Number of data points to keep
+MAX_ANOMALIES = 1000  # Number of anomaly records to keep
+TICK_UPDATE_INTERVAL = 5  # Recompute x-axis time labels every N samples
+MIN_REFRESH_MS = 500  # Poll interval for new data, and minimum gap between two UI refreshes
+LOG_DRAIN_MS = 250  # Interval between log queue drains into the Logs tab
+LOG_DRAIN_BATCH = 200  # Maximum log messages written per drain
+
+# Large drone payloads arrive as a zero byte and a 4-byte body length, then a zstd body
+COMPRESSED_FRAME_HEADER = struct.Struct(">BI")
+zstd_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+MAX_COMPRESSED_FRAME_SIZE = 1 << 20  # Larger declared lengths are treated as a corrupt stream
+
+class RingBuffer:
+    """Fixed-size NumPy ring buffer for chart series"""
+    
+    def __init__(self, size):
+        self.buf = np.zeros(size, dtype=np.float64)
+        self.head = 0  # Total number of values ever appended
+    
+    def __len__(self):
+        return min(self.head, len(self.buf))
+    
+    def append(self, value):
+        self.buf[self.head % len(self.buf)] = value
+        self.head += 1
+    
+    def view(self):
+        """Return the stored values oldest first (a slice until the buffer wraps)"""
+        head = self.head  # Read once; the writer may append concurrently
+        size = len(self.buf)
+        if head <= size:
+            return self.buf[:head]
+        split = head % size
+        return np.concatenate((self.buf[split:], self.buf[:split]))
+
+# Anomaly descriptions are classified by the first sensor keyword they mention
+_ANOMALY_KIND_RE = re.compile(r"(temperature)|(humidity)", re.IGNORECASE)
 
 # Global variables for data storage
 drones_data = {}  # Store data for each drone
-temperature_history = deque(maxlen=DATA_HISTORY_SIZE)
-humidity_history = deque(maxlen=DATA_HISTORY_SIZE)
+temperature_history = RingBuffer(DATA_HISTORY_SIZE)
+humidity_history = RingBuffer(DATA_HISTORY_SIZE)
 timestamps = deque(maxlen=DATA_HISTORY_SIZE)
-anomalies_history = []  # Store anomalies
+anomalies_history = deque(maxlen=MAX_ANOMALIES)  # Store the most recent anomalies
+anomaly_counts = {"temp": 0, "humid": 0, "total": 0}  # Running anomaly statistics
 data_received = False  # Flag to indicate if any data has been received
+samples_received = 0  # Total number of timestamps appended to the chart history
 
-# Lock for thread safety
-lock = threading.Lock()
+# One lock per drone for its entry in drones_data; drone_locks_lock only guards registration
+drone_locks = {}
+drone_locks_lock = threading.Lock()
 
-def handle_drone(conn, addr, gui_log):
-    with conn:
-        gui_log(f"Connected to drone at {addr}")
-        try:
-            data = conn.recv(4096)
-            if data:
+# Set by drone handlers whenever shared data changes; the UI refreshes only when set
+data_dirty = threading.Event()
+
+# Log messages from any thread, written to the Tk widgets by the main thread
+log_queue = queue.Queue()
+
+def get_drone_lock(drone_id):
+    """Return the lock for drone_id, registering the drone on first contact"""
+    drone_lock = drone_locks.get(drone_id)
+    if drone_lock is None:
+        with drone_locks_lock:
+            if drone_id not in drone_locks:
+                drones_data[drone_id] = {
+                    "avg_temperature": deque(maxlen=DATA_HISTORY_SIZE),
+                    "avg_humidity": deque(maxlen=DATA_HISTORY_SIZE),
+                    "timestamps": deque(maxlen=DATA_HISTORY_SIZE),
+                    "battery_level": 0,
+                    "status": "Unknown",
+                    "connected_sensors": [],
+                    "last_update_str": "N/A"
+                }
+                drone_locks[drone_id] = threading.Lock()
+            drone_lock = drone_locks[drone_id]
+    return drone_lock
+
+def process_message(data, addr, gui_log):
+    global data_received, samples_received
+    try:
+        decoded = _json.loads(data)
+        drone_id = decoded.get("drone_id", "unknown")
+        has_sensor_data = "avg_temperature" in decoded and "avg_humidity" in decoded
+        
+        # Parse and format the timestamp once here instead of on every UI refresh
+        current_time = datetime.datetime.fromisoformat(decoded["timestamp"].replace('Z', '+00:00'))
+        fmt_timestamp = current_time.strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Per-drone state is only guarded by that drone's lock
+        with get_drone_lock(drone_id):
+            drone = drones_data[drone_id]
+            
+            # Only update sensor data if it's provided
+            if has_sensor_data:
+                drone["avg_temperature"].append(decoded["avg_temperature"])
+                drone["avg_humidity"].append(decoded["avg_humidity"])
+            
+            # Always update these fields
+            drone["timestamps"].append(decoded["timestamp"])
+            drone["battery_level"] = decoded.get("battery_level", 0)
+            drone["status"] = decoded.get("drone_status", "Unknown")
+            drone["last_update_str"] = fmt_timestamp
+            
+            # Update connected sensors if provided
+            if "connected_sensors" in decoded:
+                drone["connected_sensors"] = decoded["connected_sensors"]
+        
+        # The shared histories are only appended to from the server thread, and
+        # single appends are atomic under the GIL, so they need no lock
+        data_received = True
+        if has_sensor_data:
+            temperature_history.append(decoded["avg_temperature"])
+            humidity_history.append(decoded["avg_humidity"])
+        timestamps.append(current_time)
+        samples_received += 1
+        
+        # Handle anomalies if provided
+        if "anomalies" in decoded and decoded["anomalies"]:
+            for anomaly in decoded["anomalies"]:
+                # Classify once here so the UI never rescans the history
+                match = _ANOMALY_KIND_RE.search(anomaly)
+                kind = "temp" if match and match.group(1) else "humid"
+                anomaly_counts[kind] += 1
+                anomaly_counts["total"] += 1
+                anomaly_record = {
+                    "seq": anomaly_counts["total"],
+                    "drone_id": drone_id,
+                    "timestamp": decoded["timestamp"],
+                    "fmt_timestamp": fmt_timestamp,
+                    "description": anomaly,
+                    "kind": kind
+                }
+                anomalies_history.append(anomaly_record)
+                gui_log(f"Anomaly from {drone_id}: {anomaly}")
+        
+        data_dirty.set()
+        
+        # Log the received data
+        if has_sensor_data:
+            gui_log(f"Received from {drone_id}: Avg Temp={decoded['avg_temperature']}°C, Avg Humidity={decoded['avg_humidity']}%, Status={decoded.get('drone_status', 'Unknown')}, Battery={decoded.get('battery_level', 'Unknown')}%")
+        else:
+            gui_log(f"Status Update from {drone_id}: Status={decoded.get('drone_status', 'Unknown')}, Battery={decoded.get('battery_level', 'Unknown')}%")
+        
+    except JSONDecodeError:
+        gui_log(f"Invalid JSON received from {addr}")
+    except Exception as e:
+        gui_log(f"Error processing data: {e}")
+
+def accept_drone(sel, server, gui_log):
+    try:
+        conn, addr = server.accept()
+    except BlockingIOError:
+        return
+    except Exception as e:
+        gui_log(f"Error accepting connection: {e}")
+        return
+    
+    try:
+        conn.setblocking(False)
+        # Deliver small status frames immediately and let the kernel batch reads
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_SIZE)
+    except Exception as e:
+        conn.close()
+        gui_log(f"Error setting up connection from {addr}: {e}")
+        return
+    
+    # Each connection keeps its address and a receive buffer for partial frames
+    sel.register(conn, selectors.EVENT_READ, (addr, bytearray()))
+    gui_log(f"Connected to drone at {addr}")
+
+def read_drone(sel, key, gui_log):
+    conn = key.fileobj
+    addr, buf = key.data
+    try:
+        chunk = conn.recv(RECV_CHUNK_SIZE)
+    except BlockingIOError:
+        return
+    except Exception as e:
+        gui_log(f"Error handling drone connection: {e}")
+        chunk = b""
+    
+    if not chunk:
+        sel.unregister(conn)
+        conn.close()
+        gui_log(f"Disconnected drone at {addr}")
+        return
+    
+    # Drones send newline-delimited JSON over a persistent connection; hand each
+    # complete line or compressed frame to process_message and keep any partial
+    # tail for the next read
+    buf += chunk
+    start = 0
+    # The unframed tail left by the previous read had no newline, so only scan the new bytes
+    search_from = len(buf) - len(chunk)
+    while start < len(buf):
+        if buf[start] == 0:
+            body_start = start + COMPRESSED_FRAME_HEADER.size
+            if body_start > len(buf):
+                break
+            _, length = COMPRESSED_FRAME_HEADER.unpack_from(buf, start)
+            if length > MAX_COMPRESSED_FRAME_SIZE:
+                # Framing is lost, so resynchronising isn't possible; drop the connection
+                gui_log(f"Invalid compressed frame length {length} from {addr}, disconnecting")
+                sel.unregister(conn)
+                conn.close()
+                return
+            end = body_start + length
+            if end > len(buf):
+                break
+            if zstd_decompressor is None:
+                gui_log(f"Dropped compressed message from {addr}: zstandard is not installed")
+            else:
                 try:
-                    decoded = json.loads(data.decode())
-                    drone_id = decoded.get("drone_id", "unknown")
-                    
-                    with lock:
-                        global data_received
-                        data_received = True
-                        
-                        # Update drone data
-                        if drone_id not in drones_data:
-                            drones_data[drone_id] = {
-                                "avg_temperature": [],
-                                "avg_humidity": [],
-                                "timestamps": [],
-                                "battery_level": 0,
-                                "status": "Unknown",
-                                "connected_sensors": []
-                            }
-                        
-                        # Only update sensor data if it's provided
-                        if "avg_temperature" in decoded and "avg_humidity" in decoded:
-                            drones_data[drone_id]["avg_temperature"].append(decoded["avg_temperature"])
-                            drones_data[drone_id]["avg_humidity"].append(decoded["avg_humidity"])
-                            # Update global history for charts
-                            temperature_history.append(decoded["avg_temperature"])
-                            humidity_history.append(decoded["avg_humidity"])
-                        
-                        # Always update these fields
-                        drones_data[drone_id]["timestamps"].append(decoded["timestamp"])
-                        drones_data[drone_id]["battery_level"] = decoded.get("battery_level", 0)
-                        drones_data[drone_id]["status"] = decoded.get("drone_status", "Unknown")
-                        
-                        # Update connected sensors if provided
-                        if "connected_sensors" in decoded:
-                            drones_data[drone_id]["connected_sensors"] = decoded["connected_sensors"]
-                        
-                        # Update timestamp for charts
-                        current_time = datetime.datetime.fromisoformat(decoded["timestamp"].replace('Z', '+00:00'))
-                        timestamps.append(current_time)
-                        
-                        # Handle anomalies if provided
-                        if "anomalies" in decoded and decoded["anomalies"]:
-                            for anomaly in decoded["anomalies"]:
-                                anomaly_record = {
-                                    "drone_id": drone_id,
-                                    "timestamp": decoded["timestamp"],
-                                    "description": anomaly
-                                }
-                                anomalies_history.append(anomaly_record)
-                                gui_log(f"Anomaly from {drone_id}: {anomaly}")
-                    
-                    # Log the received data
-                    if "avg_temperature" in decoded and "avg_humidity" in decoded:
-                        gui_log(f"Received from {drone_id}: Avg Temp={decoded['avg_temperature']}°C, Avg Humidity={decoded['avg_humidity']}%, Status={decoded.get('drone_status', 'Unknown')}, Battery={decoded.get('battery_level', 'Unknown')}%")
-                    else:
-                        gui_log(f"Status Update from {drone_id}: Status={decoded.get('drone_status', 'Unknown')}, Battery={decoded.get('battery_level', 'Unknown')}%")
-                    
-                except json.JSONDecodeError:
-                    gui_log(f"Invalid JSON received from {addr}")
-                except Exception as e:
-                    gui_log(f"Error processing data: {e}")
-        except Exception as e:
-            gui_log(f"Error handling drone connection: {e}")
-    
-    gui_log(f"Disconnected drone at {addr}")
+                    process_message(zstd_decompressor.decompress(buf[body_start:end]), addr, gui_log)
+                except zstandard.ZstdError as e:
+                    gui_log(f"Error decompressing message from {addr}: {e}")
+            start = end
+            continue
+        end = buf.find(b"\n", max(start, search_from))
+        if end == -1:
+            if len(buf) - start > MAX_LINE_SIZE:
+                # A peer that never sends a newline must not grow the buffer forever
+                gui_log(f"Message from {addr} exceeds {MAX_LINE_SIZE} bytes without a newline, disconnecting")
+                sel.unregister(conn)
+                conn.close()
+                return
+            break
+        if end > start:
+            process_message(buf[start:end], addr, gui_log)
+        start = end + 1
+    del buf[:start]
 
 def start_server(gui_log):
     server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -102,15 +268,19 @@ def start_server(gui_log):
     try:
         server.bind(("0.0.0.0", CENTRAL_PORT))
         server.listen(5)
+        server.setblocking(False)
         gui_log(f"Central Server listening on port {CENTRAL_PORT}")
         
+        # A single selector (epoll on Linux) multiplexes the listener and every drone connection
+        sel = selectors.DefaultSelector()
+        sel.register(server, selectors.EVENT_READ)
+        
         while True:
-            try:
-                conn, addr = server.accept()
-                threading.Thread(target=handle_drone, args=(conn, addr, gui_log), daemon=True).start()
-            except Exception as e:
-                gui_log(f"Error accepting connection: {e}")
-                time.sleep(1)
+            for key, _ in sel.select():
+                if key.fileobj is server:
+                    accept_drone(sel, server, gui_log)
+                else:
+                    read_drone(sel, key, gui_log)
     except Exception as e:
         gui_log(f"Failed to start server: {e}")
         return
@@ -166,14 +336,14 @@ def start_gui():
     ax1.set_ylim(10, 40)
     ax1.grid(True, linestyle='--', alpha=0.7)
     ax1.set_ylabel('Temperature (°C)', fontsize=10)
-    temp_line, = ax1.plot([], [], 'r-', linewidth=2)
+    temp_line, = ax1.plot([], [], 'r-', linewidth=2, animated=True)
 
     # Humidity axis with proper configuration
     ax2.set_title('Average Humidity (%)', fontsize=11, pad=10)
     ax2.set_ylim(0, 100)
     ax2.grid(True, linestyle='--', alpha=0.7)
     ax2.set_ylabel('Humidity (%)', fontsize=10)
-    hum_line, = ax2.plot([], [], 'b-', linewidth=2)
+    hum_line, = ax2.plot([], [], 'b-', linewidth=2, animated=True)
 
     # Apply tight layout with additional padding
     fig.tight_layout(pad=3.0)
@@ -182,6 +352,23 @@ def start_gui():
     canvas = FigureCanvasTkAgg(fig, master=chart_frame)
     canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
     
+    # Blitting: the lines are animated artists drawn over cached axes backgrounds.
+    # Every full draw (including window resizes) refreshes the cached backgrounds.
+    chart_backgrounds = {}
+    
+    def on_canvas_draw(event):
+        for ax, line in ((ax1, temp_line), (ax2, hum_line)):
+            chart_backgrounds[ax] = canvas.copy_from_bbox(ax.bbox)
+            ax.draw_artist(line)
+    
+    canvas.mpl_connect('draw_event', on_canvas_draw)
+    
+    def blit_lines():
+        for ax, line in ((ax1, temp_line), (ax2, hum_line)):
+            canvas.restore_region(chart_backgrounds[ax])
+            ax.draw_artist(line)
+            canvas.blit(ax.bbox)
+    
     # Anomalies tab
     anomalies_frame = ttk.Frame(notebook)
     notebook.add(anomalies_frame, text="Anomalies")
@@ -238,125 +425,220 @@ def start_gui():
     
     # Define the log function
     def gui_log(message):
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        log_text.see(tk.END)
-        status_var.set(message)
+        log_queue.put_nowait((time.strftime("%Y-%m-%d %H:%M:%S"), message))
+    
+    # Write queued log messages in one batch per drain
+    def drain_logs():
+        lines = []
+        message = None
+        try:
+            for _ in range(LOG_DRAIN_BATCH):
+                timestamp, message = log_queue.get_nowait()
+                lines.append(f"[{timestamp}] {message}\n")
+        except queue.Empty:
+            pass
+        
+        if lines:
+            log_text.insert(tk.END, "".join(lines))
+            log_text.see(tk.END)
+            status_var.set(message)
+        root.after(LOG_DRAIN_MS, drain_logs)
+    
+    # Configure row tag colors once; rows only reference the tags
+    drone_tree.tag_configure("returning", background="#ffe0b3")
+    drone_tree.tag_configure("normal", background="#ffffff")
+    anomalies_tree.tag_configure("temp_anomaly", background="#ffcccc")
+    anomalies_tree.tag_configure("humid_anomaly", background="#cce5ff")
+    
+    # Sequence number of the newest anomaly shown in the anomalies table
+    last_anomaly_seq = 0
+    
+    # Last drawn snapshot row per drone in the status table
+    last_rows = {}
+    
+    # Last tick-label bucket and title values drawn on the charts
+    last_tick_bucket = -1
+    last_temp_shown = None
+    last_hum_shown = None
     
     # Function to update all UI elements
-    def update_ui():
-        with lock:
-            # Update drone status table
-            for item in drone_tree.get_children():
-                drone_tree.delete(item)
-            
-            for drone_id, data in drones_data.items():
-                last_update = "N/A"
-                if data["timestamps"]:
-                    try:
-                        timestamp = datetime.datetime.fromisoformat(data["timestamps"][-1].replace('Z', '+00:00'))
-                        last_update = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                    except:
-                        last_update = data["timestamps"][-1]
-                
-                sensors_text = ", ".join(data["connected_sensors"])
-                
-                # Create tag for row based on drone status
-                tag = "normal"
-                if data["status"] == "Returning to Base":
-                    tag = "returning"
-                
-                drone_tree.insert("", "end", text=drone_id, values=(
-                    f"{data['battery_level']}%",
+    def refresh_ui():
+        nonlocal last_anomaly_seq, last_tick_bucket, last_temp_shown, last_hum_shown
+        # Snapshot shared state first; every lock is held only for a quick copy
+        with drone_locks_lock:
+            drone_ids = list(drones_data)
+        
+        drone_rows = []
+        for drone_id in drone_ids:
+            with drone_locks[drone_id]:
+                data = drones_data[drone_id]
+                drone_rows.append((
+                    drone_id,
+                    data["battery_level"],
                     data["status"],
-                    sensors_text,
-                    last_update
-                ), tags=(tag,))
+                    tuple(data["connected_sensors"]),
+                    data["last_update_str"]
+                ))
+        
+        # Walk back from the newest anomaly to the last one already shown
+        new_anomalies = []
+        for anomaly in reversed(list(anomalies_history)):
+            if anomaly["seq"] <= last_anomaly_seq:
+                break
+            new_anomalies.append(anomaly)
+        new_anomalies.reverse()
+        if new_anomalies:
+            last_anomaly_seq = new_anomalies[-1]["seq"]
+        counts = dict(anomaly_counts)
+        
+        # Chart series trimmed to a common length in case the server thread
+        # appended to one series but not yet the other
+        temp_data = temperature_history.view()
+        hum_data = humidity_history.view()
+        n = min(len(temp_data), len(hum_data))
+        temp_data = temp_data[:n]
+        hum_data = hum_data[:n]
+        ts = list(timestamps)
+        tick_bucket = samples_received // TICK_UPDATE_INTERVAL
+        
+        # Render from the snapshot without touching shared state
+        # Update drone status table in place, one row per drone (iid = drone_id),
+        # skipping rows whose fields are unchanged since they were last drawn
+        for row in drone_rows:
+            drone_id, battery_level, status, connected_sensors, last_update = row
+            if last_rows.get(drone_id) == row:
+                continue
+            last_rows[drone_id] = row
             
-            # Configure tag colors
-            drone_tree.tag_configure("returning", background="#ffe0b3")
-            drone_tree.tag_configure("normal", background="#ffffff")
+            sensors_text = ", ".join(connected_sensors)
             
-            # Update anomalies table
-            for item in anomalies_tree.get_children():
-                anomalies_tree.delete(item)
+            # Create tag for row based on drone status
+            tag = "normal"
+            if status == "Returning to Base":
+                tag = "returning"
             
-            for anomaly in anomalies_history:
-                timestamp = datetime.datetime.fromisoformat(anomaly["timestamp"].replace('Z', '+00:00'))
-                formatted_timestamp = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                
-                # Add different tags based on type of anomaly
-                tag = "temp_anomaly" if "temperature" in anomaly["description"].lower() else "humid_anomaly"
-                
-                anomalies_tree.insert("", 0, text=anomaly["drone_id"], values=(
-                    formatted_timestamp,
-                    anomaly["description"]
-                ), tags=(tag,))
+            values = (
+                f"{battery_level}%",
+                status,
+                sensors_text,
+                last_update
+            )
+            if drone_tree.exists(drone_id):
+                drone_tree.item(drone_id, values=values, tags=(tag,))
+            else:
+                drone_tree.insert("", "end", iid=drone_id, text=drone_id, values=values, tags=(tag,))
+        
+        # Prepend only the anomalies received since the last update
+        for anomaly in new_anomalies:
+            # Add different tags based on type of anomaly
+            tag = "temp_anomaly" if anomaly["kind"] == "temp" else "humid_anomaly"
+            
+            anomalies_tree.insert("", 0, text=anomaly["drone_id"], values=(
+                anomaly["fmt_timestamp"],
+                anomaly["description"]
+            ), tags=(tag,))
+        
+        # Drop rows for anomalies evicted from the history in a single Tk call
+        if new_anomalies:
+            stale_rows = anomalies_tree.get_children()[MAX_ANOMALIES:]
+            if stale_rows:
+                anomalies_tree.delete(*stale_rows)
+        
+        # Update anomaly statistics
+        anomaly_count_var.set(f"Total Anomalies: {counts['total']}")
+        temp_anomaly_var.set(f"Temperature Anomalies: {counts['temp']}")
+        humid_anomaly_var.set(f"Humidity Anomalies: {counts['humid']}")
+        
+        # Update charts
+        if n > 0:
+            x_data = np.arange(n)
             
-            # Configure anomaly tag colors
-            anomalies_tree.tag_configure("temp_anomaly", background="#ffcccc")
-            anomalies_tree.tag_configure("humid_anomaly", background="#cce5ff")
+            # Update plot data
+            temp_line.set_xdata(x_data)
+            temp_line.set_ydata(temp_data)
+            hum_line.set_xdata(x_data)
+            hum_line.set_ydata(hum_data)
             
-            # Update anomaly statistics
-            temp_count = sum(1 for a in anomalies_history if "temperature" in a["description"].lower())
-            humid_count = sum(1 for a in anomalies_history if "humidity" in a["description"].lower())
+            # Axes decorations are part of the cached background; only a change
+            # to them requires a full redraw, otherwise just the lines are blitted
+            chart_dirty = False
             
-            anomaly_count_var.set(f"Total Anomalies: {len(anomalies_history)}")
-            temp_anomaly_var.set(f"Temperature Anomalies: {temp_count}")
-            humid_anomaly_var.set(f"Humidity Anomalies: {humid_count}")
+            # Update axes limits
+            if len(x_data) > 1:
+                xlim = (0, max(len(x_data) - 1, 10))
+                if ax1.get_xlim() != xlim:
+                    ax1.set_xlim(xlim)
+                    ax2.set_xlim(xlim)
+                    chart_dirty = True
             
-            # Update charts
-            if len(temperature_history) > 0 and len(humidity_history) > 0:
-                # Get data from deques
-                temp_data = list(temperature_history)
-                hum_data = list(humidity_history)
-                x_data = list(range(len(temp_data)))
-                
-                # Update plot data
-                temp_line.set_xdata(x_data)
-                temp_line.set_ydata(temp_data)
-                hum_line.set_xdata(x_data)
-                hum_line.set_ydata(hum_data)
+            # Add time labels to x-axis, only once every TICK_UPDATE_INTERVAL samples
+            if len(ts) > 0 and tick_bucket != last_tick_bucket:
+                last_tick_bucket = tick_bucket
                 
-                # Update axes limits
-                if len(x_data) > 1:
-                    ax1.set_xlim(0, max(len(x_data) - 1, 10))
-                    ax2.set_xlim(0, max(len(x_data) - 1, 10))
+                # Select a few timestamps for labels
+                num_labels = min(5, len(ts))
+                label_indices = [int(i * (len(ts) - 1) / max(1, num_labels - 1)) for i in range(num_labels)]
                 
-                # Add time labels to x-axis
-                if len(timestamps) > 0:
-                    # Select a few timestamps for labels
-                    num_labels = min(5, len(timestamps))
-                    label_indices = [int(i * (len(timestamps) - 1) / max(1, num_labels - 1)) for i in range(num_labels)]
-                    
-                    # Safety check for index bounds
-                    label_indices = [idx for idx in label_indices if idx < len(timestamps)]
-                    
-                    if label_indices:
-                        time_labels = [timestamps[i].strftime("%H:%M:%S") for i in label_indices]
-                        
-                        ax1.set_xticks(label_indices)
-                        ax1.set_xticklabels(time_labels, rotation=45, fontsize=8)
-                        ax2.set_xticks(label_indices)
-                        ax2.set_xticklabels(time_labels, rotation=45, fontsize=8)
+                # Safety check for index bounds
+                label_indices = [idx for idx in label_indices if idx < len(ts)]
                 
-                # Update titles with current values
-                if temp_data:
-                    ax1.set_title(f'Average Temperature: {temp_data[-1]:.1f}°C', fontsize=11)
-                    # Adjust y-axis if needed
-                    temp_min = min(temp_data)
-                    temp_max = max(temp_data)
-                    margin = max(2, (temp_max - temp_min) * 0.1)
-                    ax1.set_ylim(max(0, temp_min - margin), temp_max + margin)
+                if label_indices:
+                    time_labels = [ts[i].strftime("%H:%M:%S") for i in label_indices]
                     
-                if hum_data:
-                    ax2.set_title(f'Average Humidity: {hum_data[-1]:.1f}%', fontsize=11)
+                    ax1.set_xticks(label_indices)
+                    ax1.set_xticklabels(time_labels, rotation=45, fontsize=8)
+                    ax2.set_xticks(label_indices)
+                    ax2.set_xticklabels(time_labels, rotation=45, fontsize=8)
+                    chart_dirty = True
+            
+            # Update titles only when the displayed (1 decimal) value changes
+            if len(temp_data) > 0:
+                temp_shown = round(temp_data[-1], 1)
+                if temp_shown != last_temp_shown:
+                    last_temp_shown = temp_shown
+                    ax1.set_title(f'Average Temperature: {temp_shown:.1f}°C', fontsize=11)
+                    chart_dirty = True
+                # Adjust y-axis if needed
+                temp_min = float(temp_data.min())
+                temp_max = float(temp_data.max())
+                margin = max(2, (temp_max - temp_min) * 0.1)
+                ylim = (max(0, temp_min - margin), temp_max + margin)
+                if ax1.get_ylim() != ylim:
+                    ax1.set_ylim(ylim)
+                    chart_dirty = True
                 
-                # Redraw the canvas
+            if len(hum_data) > 0:
+                hum_shown = round(hum_data[-1], 1)
+                if hum_shown != last_hum_shown:
+                    last_hum_shown = hum_shown
+                    ax2.set_title(f'Average Humidity: {hum_shown:.1f}%', fontsize=11)
+                    chart_dirty = True
+            
+            # Redraw the canvas, or blit the lines over the cached backgrounds
+            if chart_dirty or not chart_backgrounds:
                 canvas.draw()
+            else:
+                blit_lines()
+    
+    # Refresh the UI only if drone data changed, at most once every MIN_REFRESH_MS
+    last_refresh = 0.0
+    
+    def schedule_update():
+        nonlocal last_refresh
+        # Checking the event is cheap, so poll often; only refresh_ui() is rate-limited
+        if not data_dirty.is_set():
+            root.after(MIN_REFRESH_MS, schedule_update)
+            return
+        
+        wait_ms = int(MIN_REFRESH_MS - (time.monotonic() - last_refresh) * 1000)
+        if wait_ms > 0:
+            root.after(wait_ms, schedule_update)
+            return
         
-        # Schedule the next update
-        root.after(1000, update_ui)
+        data_dirty.clear()
+        last_refresh = time.monotonic()
+        refresh_ui()
+        root.after(MIN_REFRESH_MS, schedule_update)
     
     # Start server in a separate thread
     threading.Thread(target=start_server, args=(gui_log,), daemon=True).start()
@@ -364,8 +646,9 @@ def start_gui():
     # Initial log
     gui_log("Central Server started")
     
-    # Start the UI update loop
-    update_ui()
+    # Start the UI update and log drain loops
+    schedule_update()
+    drain_logs()
     
     # Start the main loop
     root.mainloop()
@@ -1,54 +1,134 @@
+import asyncio
+import calendar
+import math
+import os
 import socket
+import struct
 import threading
 import tkinter as tk
 from tkinter import ttk
-import json
 import time
 import random
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from collections import deque
+from collections import deque, namedtuple
 import datetime
 import queue
 import logging
 from contextlib import contextmanager
+from functools import lru_cache
+
+try:
+    import orjson as _json  # Parses and serializes bytes directly, several times faster than stdlib json
+    encode_json = _json.dumps
+    decode_json = _json.loads  # Accepts a memoryview, so lines are parsed without a copy
+except ImportError:
+    import json as _json
+
+    def encode_json(obj):
+        return _json.dumps(obj).encode()
+
+    def decode_json(data):
+        return _json.loads(bytes(data))
+JSONDecodeError = _json.JSONDecodeError
+
+try:
+    import zstandard  # Optional: compresses large forward payloads
+except ImportError:
+    zstandard = None
 
 SENSOR_PORT = 8888
 CENTRAL_IP = "127.0.0.1"
 CENTRAL_PORT = 6000
+SENSOR_LISTENERS = min(4, os.cpu_count() or 1)  # Accept loops sharing the sensor port via SO_REUSEPORT
+SENSOR_QUEUE_SIZE = 10000  # Readings waiting for the consumer; new ones are dropped when full
+SENSOR_RECV_BUFFER_SIZE = 8192  # Preallocated receive buffer per sensor connection
+SENSOR_KEEPIDLE = 30  # Seconds a sensor connection may idle before keepalive probes start
+DROP_WARNING_INTERVAL = 10.0  # Minimum seconds between overload warnings per sensor connection
+CENTRAL_KEEPIDLE = 30  # Seconds of idle time before TCP keepalive probes start
+COMPRESS_FORWARDS = False  # zstd-compress large forwards; enable only if the central server has zstandard too
+COMPRESS_MIN_SIZE = 1024  # Forward payloads larger than this are compressed when COMPRESS_FORWARDS is on
 
 # Configuration parameters
 MAX_BATTERY_LEVEL = 100
 BATTERY_THRESHOLD = 20
 BATTERY_DRAIN_RATE = 1  # % per 10 seconds
 BATTERY_CHARGE_RATE = 5  # % per 10 seconds
+BATTERY_INTERVAL = 10.0  # Seconds between battery updates
+FORWARD_INTERVAL = 5.0  # Seconds between forwards and status updates to central
 ANOMALY_TEMP_RANGE = (15, 35)  # Normal temperature range
 ANOMALY_HUMIDITY_RANGE = (30, 70)  # Normal humidity range
+TEMP_MIN, TEMP_MAX = ANOMALY_TEMP_RANGE
+HUMIDITY_MIN, HUMIDITY_MAX = ANOMALY_HUMIDITY_RANGE
+TEMP_ANOMALY_FORMAT = "Temperature anomaly detected: %s°C from %s"
+HUMIDITY_ANOMALY_FORMAT = "Humidity anomaly detected: %s%% from %s"
 DATA_BUFFER_SIZE = 100  # Number of data points to keep for visualization
+MAX_PENDING_ANOMALIES = 1000  # Anomalies held for the next forward; oldest dropped during outages
+CHART_INTERVAL = 2.0  # Seconds between chart refreshes
+TICK_UPDATE_INTERVAL = 5  # Relabel the time axis once per this many new readings
+LOG_BUFFER_SIZE = 1000  # Number of formatted log lines kept in memory
+LOG_DRAIN_BATCH = 200  # Max log lines written to the widget per drain
+LOG_QUEUE_SIZE = 10000  # Pending log messages kept if the GUI falls behind; oldest are dropped
+GUI_LOG_LEVEL = logging.INFO  # Messages below this level are dropped before formatting; DEBUG shows every reading
+
+class RingBuffer:
+    """Fixed-size NumPy ring buffer for chart series"""
+    
+    def __init__(self, size):
+        self.buf = np.zeros(size, dtype=np.float64)
+        self.head = 0  # Total number of values ever appended
+    
+    def __len__(self):
+        return min(self.head, len(self.buf))
+    
+    def append(self, value):
+        self.buf[self.head % len(self.buf)] = value
+        self.head += 1
+    
+    def view(self):
+        """Return the stored values oldest first (a slice until the buffer wraps)"""
+        head = self.head  # Read once; the writer may append concurrently
+        size = len(self.buf)
+        if head <= size:
+            return self.buf[:head]
+        split = head % size
+        return np.concatenate((self.buf[split:], self.buf[:split]))
 
 # Global variables
-sensor_data_buffer = []
+# Running aggregates of readings not yet forwarded to the central server
+temp_sum = 0.0
+hum_sum = 0.0
+sample_count = 0
+pending_anomalies = deque(maxlen=MAX_PENDING_ANOMALIES)
 data_history = {}  # Store data history for each sensor
-battery_level = MAX_BATTERY_LEVEL
-drone_status = "Active"  # "Active" or "Returning to Base"
-returning_to_base = False
-log_buffer = []
+# Battery and flight status, republished as a whole under status_lock; readers take no lock
+DroneState = namedtuple('DroneState', 'status battery returning')  # status: "Active" or "Returning to Base"
+drone_state = DroneState("Active", MAX_BATTERY_LEVEL, False)
+log_buffer = deque(maxlen=LOG_BUFFER_SIZE)
 connected_sensors = set()
-temperature_history = deque(maxlen=DATA_BUFFER_SIZE)
-humidity_history = deque(maxlen=DATA_BUFFER_SIZE)
+chart_frame = None  # Latest (head, temps, hums, label_indices, time_labels) prepared off the Tk thread
+connected_sensors_snapshot = ()  # Immutable copy republished on every change; readers need no lock
+connected_sensors_json = ((), b"[]")  # (snapshot, encoded list) last sent to central
+temperature_history = RingBuffer(DATA_BUFFER_SIZE)
+humidity_history = RingBuffer(DATA_BUFFER_SIZE)
 timestamps = deque(maxlen=DATA_BUFFER_SIZE)
 
 # Thread-safe queues for better communication
-log_queue = queue.Queue()
+log_queue = deque(maxlen=LOG_QUEUE_SIZE)  # (timestamp, message, args) drained and formatted on the Tk thread
 gui_update_queue = queue.Queue()
+sensor_queue = queue.Queue(maxsize=SENSOR_QUEUE_SIZE)  # (reading, sensor_id) pairs; a None reading marks a disconnect
+pending_disconnects = deque()  # Disconnect markers that found sensor_queue full; unbounded so they're never lost
 
 # Improved locks
-data_lock = threading.RLock()  # Re-entrant lock for nested operations
-status_lock = threading.RLock()
+data_lock = threading.Lock()  # Guards the running aggregates and pending anomalies
+chart_lock = threading.Lock()  # Guards the chart histories
+status_lock = threading.Lock()  # Serializes writers of drone_state
 
 # Server control
 server_running = True
-server_socket = None
+event_loop = None  # asyncio loop running the network tasks
+sensor_loops = []  # Extra asyncio loops, each accepting sensors on its own SO_REUSEPORT listener
 
 @contextmanager
 def safe_lock(lock):
@@ -63,6 +143,42 @@ def safe_lock(lock):
         if acquired:
             lock.release()
 
+@lru_cache(maxsize=DATA_BUFFER_SIZE)
+def format_time_label(iso_timestamp):
+    """Convert a sensor's ISO timestamp to a local HH:MM:SS chart label, or None if it can't be parsed"""
+    try:
+        # Sensors send a fixed YYYY-MM-DDTHH:MM:SS[.ffffff]Z layout in UTC, so read the fields by
+        # position; anything else (e.g. an explicit offset) goes through fromisoformat
+        tail = iso_timestamp[19:]
+        if tail in ("", "Z") or (tail[0] == "." and tail[-1] == "Z" and tail[1:-1].isdigit()):
+            epoch = calendar.timegm((
+                int(iso_timestamp[0:4]), int(iso_timestamp[5:7]), int(iso_timestamp[8:10]),
+                int(iso_timestamp[11:13]), int(iso_timestamp[14:16]), int(iso_timestamp[17:19])
+            ))
+        else:
+            parsed = datetime.datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+            epoch = parsed.timestamp()
+    except (ValueError, TypeError, OverflowError):
+        return None
+    return time.strftime("%H:%M:%S", time.localtime(epoch))
+
+# (epoch second, log timestamp, ISO timestamp), replaced as a whole so readers need no lock
+timestamp_cache = (None, "", "")
+
+def current_timestamps():
+    """Return the (log, ISO) timestamps for the current second, formatting them once per second"""
+    global timestamp_cache
+    now = int(time.time())
+    cache = timestamp_cache
+    if cache[0] != now:
+        local = time.localtime(now)
+        cache = timestamp_cache = (
+            now, time.strftime("%Y-%m-%d %H:%M:%S", local), time.strftime("%Y-%m-%dT%H:%M:%SZ", local)
+        )
+    return cache
+
 def setup_logging():
     """Setup proper logging"""
     logging.basicConfig(
@@ -77,310 +193,473 @@ def setup_logging():
 
 logger = setup_logging()
 
-def handle_sensor(conn, addr, gui_log):
-    """Improved sensor handler with better error handling and non-blocking operations"""
-    sensor_id = None
-    conn.settimeout(5.0)  # Set socket timeout
-    
-    try:
-        with conn:
-            gui_log(f"Connected to sensor at {addr}")
-            
-            while server_running:
-                try:
-                    # Check if we're returning to base before receiving data
-                    with safe_lock(status_lock):
-                        if returning_to_base:
-                            gui_log(f"Disconnecting sensor at {addr} - Drone is returning to base")
-                            break
-
-                    # Non-blocking receive with timeout
-                    data = conn.recv(1024)
-                    if not data:
-                        break
-                    
-                    # Check again after receiving data
-                    with safe_lock(status_lock):
-                        if returning_to_base:
-                            gui_log(f"Discarding data from {addr} - Drone is returning to base")
-                            continue
-
-                    decoded = json.loads(data.decode())
-                    sensor_id = decoded['sensor_id']
-                    
-                    # Process data in separate thread to avoid blocking
-                    threading.Thread(
-                        target=process_sensor_data, 
-                        args=(decoded, sensor_id, gui_log),
-                        daemon=True
-                    ).start()
-                    
-                except socket.timeout:
-                    # Check if we should continue or break
-                    with safe_lock(status_lock):
-                        if returning_to_base:
-                            break
+class SensorProtocol(asyncio.BufferedProtocol):
+    """Receive newline-delimited JSON readings into one preallocated buffer per sensor"""
+
+    def __init__(self, gui_log):
+        self.gui_log = gui_log
+        self.buffer = bytearray(SENSOR_RECV_BUFFER_SIZE)
+        self.view = memoryview(self.buffer)
+        self.start = 0  # Offset of the first unparsed byte
+        self.filled = 0  # Offset just past the last received byte
+        self.transport = None
+        self.addr = None
+        self.sensor_id = None
+        self.dropped = 0  # Readings discarded because the consumer fell behind
+        self.next_drop_warning = 0.0  # Monotonic time before which further drops aren't reported
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.addr = transport.get_extra_info('peername')
+        if drone_state.returning:
+            # Reject connection if returning to base
+            transport.close()
+            self.gui_log(f"Rejected sensor connection from {self.addr} - Drone is returning to base")
+            return
+        # asyncio already disables Nagle; keepalive lets a silently dead sensor drop out of the set
+        sock = transport.get_extra_info('socket')
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, SENSOR_KEEPIDLE)
+        self.gui_log(f"Connected to sensor at {self.addr}")
+
+    def get_buffer(self, sizehint):
+        # The kernel copies straight into the free tail of the buffer
+        return self.view[self.filled:]
+
+    def buffer_updated(self, nbytes):
+        # Bytes before this read were already searched, so only scan the new ones for newlines
+        search_from = self.filled
+        self.filled += nbytes
+        if drone_state.returning:
+            self.gui_log(f"Disconnecting sensor at {self.addr} - Drone is returning to base")
+            self.transport.close()
+            return
+
+        start = self.start
+        while True:
+            end = self.buffer.find(b"\n", search_from, self.filled)
+            if end < 0:
+                break
+            line = self.view[start:end]
+            start = search_from = end + 1
+            try:
+                decoded = decode_json(line)
+                sensor_id = decoded['sensor_id']
+                if not isinstance(sensor_id, str):
+                    # The ID is used as a set member and in disconnect markers, so it must be hashable
+                    self.gui_log(f"Invalid sensor_id from {self.addr}: {sensor_id!r}")
                     continue
-                    
-                except json.JSONDecodeError as e:
-                    gui_log(f"Invalid JSON from {addr}: {e}")
-                    break
-                    
-                except Exception as e:
-                    logger.error(f"Error handling sensor data from {addr}: {e}")
-                    break
-                    
-    except Exception as e:
-        logger.error(f"Connection error with {addr}: {e}")
-    finally:
-        # Clean up sensor connection
-        if sensor_id:
-            with safe_lock(data_lock):
+                self.sensor_id = sensor_id
+                sensor_queue.put_nowait((decoded, sensor_id))
+            except queue.Full:
+                # Never block the event loop on a saturated consumer
+                self.dropped += 1
+                now = time.monotonic()
+                if now >= self.next_drop_warning:
+                    logger.warning(f"Dropping readings from {self.addr}: processing queue full ({self.dropped} so far)")
+                    self.next_drop_warning = now + DROP_WARNING_INTERVAL
+            except JSONDecodeError as e:
+                # Framing lets us drop just the bad line and resync on the next one
+                self.gui_log(f"Invalid JSON from {self.addr}: {e}")
+            except Exception as e:
+                logger.error(f"Error handling sensor data from {self.addr}: {e}")
+        self.start = start
+
+        if self.start == self.filled:
+            # Everything was consumed (the usual case), so rewind without copying
+            self.start = self.filled = 0
+        elif self.filled == len(self.buffer):
+            if not self.start:
+                logger.error(f"Reading from {self.addr} exceeds {SENSOR_RECV_BUFFER_SIZE} bytes")
+                self.transport.close()
+                return
+            # Buffer is full: move the trailing partial line to the front
+            remaining = self.filled - self.start
+            self.buffer[:remaining] = self.buffer[self.start:self.filled]
+            self.start, self.filled = 0, remaining
+
+    def connection_lost(self, exc):
+        # Clean up sensor connection after any readings still queued for it
+        if self.sensor_id:
+            try:
+                sensor_queue.put_nowait((None, self.sensor_id))
+            except queue.Full:
+                # Never block the loop; the consumer applies these once the queue has drained
+                pending_disconnects.append(self.sensor_id)
+        if self.dropped:
+            logger.warning(f"Dropped {self.dropped} readings from {self.addr}: processing queue full")
+        self.gui_log(f"Disconnected sensor at {self.addr}")
+
+def consume_sensor_data(gui_log):
+    """Apply queued sensor readings in arrival order on a single consumer thread"""
+    global connected_sensors_snapshot
+    while server_running:
+        try:
+            decoded, sensor_id = sensor_queue.get(timeout=1.0)
+        except queue.Empty:
+            decoded = sensor_id = None
+        
+        # This is the only consumer, so one bad item must not end the thread
+        try:
+            if decoded is not None:
+                process_sensor_data(decoded, sensor_id, gui_log)
+            elif sensor_id in connected_sensors:
                 connected_sensors.discard(sensor_id)
-        gui_log(f"Disconnected sensor at {addr}")
+                connected_sensors_snapshot = tuple(connected_sensors)
+            
+            # Disconnects that overflowed the queue follow every reading queued before them
+            if pending_disconnects and sensor_queue.empty():
+                while pending_disconnects:
+                    connected_sensors.discard(pending_disconnects.popleft())
+                connected_sensors_snapshot = tuple(connected_sensors)
+        except Exception as e:
+            logger.error(f"Error applying sensor queue item for {sensor_id!r}: {e}")
 
 def process_sensor_data(decoded, sensor_id, gui_log):
-    """Process sensor data in separate thread to avoid blocking"""
+    """Record one sensor reading and check it for anomalies"""
+    global temp_sum, hum_sum, sample_count, connected_sensors_snapshot
     try:
+        temperature = decoded['temperature']
+        humidity = decoded['humidity']
+        timestamp = decoded['timestamp']
+        # The stdlib JSON parser accepts NaN/Infinity; such values would poison the
+        # averages and make the forward payload invalid JSON
+        if not (math.isfinite(temperature) and math.isfinite(humidity)):
+            gui_log(f"Ignored non-finite reading from {sensor_id}")
+            return
+        # Parsing here also warms the label cache, since tick labels come from recent readings
+        if not isinstance(timestamp, str) or format_time_label(timestamp) is None:
+            gui_log(f"Ignored reading with invalid timestamp from {sensor_id}: {timestamp!r}")
+            return
+        
+        # Anomalies are kept as (format, value, sensor_id) and only rendered to text
+        # when forwarded or logged
+        temp_anomaly = hum_anomaly = None
+        if not (TEMP_MIN <= temperature <= TEMP_MAX):
+            temp_anomaly = (TEMP_ANOMALY_FORMAT, temperature, sensor_id)
+        if not (HUMIDITY_MIN <= humidity <= HUMIDITY_MAX):
+            hum_anomaly = (HUMIDITY_ANOMALY_FORMAT, humidity, sensor_id)
+        
+        # Only the consumer thread touches the set; others read the published snapshot
+        is_new = sensor_id not in connected_sensors
+        if is_new:
+            connected_sensors.add(sensor_id)
+            connected_sensors_snapshot = tuple(connected_sensors)
+        
+        # Forwarding state: running aggregates and pending anomalies
         with safe_lock(data_lock):
-            if sensor_id not in connected_sensors:
-                connected_sensors.add(sensor_id)
-                gui_log(f"New sensor registered: {sensor_id}")
-            
-            # Check for anomalies
-            anomalies = []
-            if not (ANOMALY_TEMP_RANGE[0] <= decoded['temperature'] <= ANOMALY_TEMP_RANGE[1]):
-                anomaly = f"Temperature anomaly detected: {decoded['temperature']}°C from {sensor_id}"
-                anomalies.append(anomaly)
-                gui_log(anomaly)
-            
-            if not (ANOMALY_HUMIDITY_RANGE[0] <= decoded['humidity'] <= ANOMALY_HUMIDITY_RANGE[1]):
-                anomaly = f"Humidity anomaly detected: {decoded['humidity']}% from {sensor_id}"
-                anomalies.append(anomaly)
-                gui_log(anomaly)
-            
-            # Add anomaly flag to data
-            decoded['anomalies'] = anomalies
-            
-            # Store in buffer for processing
-            sensor_data_buffer.append(decoded)
-            
-            # Store for visualization
-            if sensor_id not in data_history:
-                data_history[sensor_id] = {'temperature': [], 'humidity': [], 'timestamps': []}
-            
-            data_history[sensor_id]['temperature'].append(decoded['temperature'])
-            data_history[sensor_id]['humidity'].append(decoded['humidity'])
-            data_history[sensor_id]['timestamps'].append(decoded['timestamp'])
-            
-            # Update global history for charts
-            temperature_history.append(decoded['temperature'])
-            humidity_history.append(decoded['humidity'])
-            
-            # Convert to local time
-            utc_time = datetime.datetime.fromisoformat(decoded['timestamp'].replace('Z', '+00:00'))
-            local_time = utc_time.astimezone()
-            timestamps.append(local_time)
-            
-        gui_log(f"Received from {sensor_id}: Temp={decoded['temperature']}°C, Humidity={decoded['humidity']}%")
+            if temp_anomaly:
+                pending_anomalies.append(temp_anomaly)
+            if hum_anomaly:
+                pending_anomalies.append(hum_anomaly)
+            temp_sum += temperature
+            hum_sum += humidity
+            sample_count += 1
+        
+        # Chart state has its own lock so the forwarder and chart updater don't contend
+        with safe_lock(chart_lock):
+            temperature_history.append(temperature)
+            humidity_history.append(humidity)
+            # Keep the raw ISO string; only the few tick labels get parsed when charting
+            timestamps.append(timestamp)
+        
+        # Only this consumer thread touches data_history, so it needs no lock
+        history = data_history.get(sensor_id)
+        if history is None:
+            history = data_history[sensor_id] = {
+                'temperature': deque(maxlen=DATA_BUFFER_SIZE),
+                'humidity': deque(maxlen=DATA_BUFFER_SIZE),
+                'timestamps': deque(maxlen=DATA_BUFFER_SIZE)
+            }
+        history['temperature'].append(temperature)
+        history['humidity'].append(humidity)
+        history['timestamps'].append(timestamp)
+        
+        if is_new:
+            gui_log(f"New sensor registered: {sensor_id}")
+        if temp_anomaly:
+            gui_log(*temp_anomaly)
+        if hum_anomaly:
+            gui_log(*hum_anomaly)
+        gui_log("Received from %s: Temp=%s°C, Humidity=%s%%", sensor_id, temperature, humidity, level=logging.DEBUG)
         
     except Exception as e:
         logger.error(f"Error processing sensor data: {e}")
 
-def start_sensor_server(gui_log):
-    """Improved sensor server with better connection handling"""
-    global server_socket, server_running
-    
+async def start_sensor_server(gui_log, reuse_port=False):
+    """Accept sensor connections on the running asyncio event loop"""
     try:
-        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        server_socket.settimeout(1.0)  # Set timeout for accept operations
-        server_socket.bind(("0.0.0.0", SENSOR_PORT))
-        server_socket.listen(10)  # Increased backlog
-        gui_log(f"Drone listening on port {SENSOR_PORT}")
-        
-        while server_running:
-            try:
-                conn, addr = server_socket.accept()
-                
-                with safe_lock(status_lock):
-                    if returning_to_base:
-                        # Reject connection if returning to base
-                        conn.close()
-                        gui_log(f"Rejected sensor connection from {addr} - Drone is returning to base")
-                        continue
-                
-                # Start handler thread with daemon flag
-                handler_thread = threading.Thread(
-                    target=handle_sensor, 
-                    args=(conn, addr, gui_log),
-                    daemon=True
-                )
-                handler_thread.start()
-                
-            except socket.timeout:
-                # Normal timeout, continue checking server_running
-                continue
-            except Exception as e:
-                if server_running:  # Only log if we're still supposed to be running
-                    logger.error(f"Error accepting connection: {e}")
-                    time.sleep(0.1)  # Brief pause before retry
-                    
+        # asyncio enables TCP_NODELAY on every TCP transport it creates
+        server = await asyncio.get_running_loop().create_server(
+            lambda: SensorProtocol(gui_log),
+            "0.0.0.0", SENSOR_PORT, backlog=10, reuse_address=True, reuse_port=reuse_port
+        )
     except Exception as e:
         logger.error(f"Server startup error: {e}")
-    finally:
-        if server_socket:
-            server_socket.close()
+        return
+    
+    gui_log(f"Drone listening on port {SENSOR_PORT}")
+    async with server:
+        await server.serve_forever()
+
+# The forward payload always has the same keys, so only the values are encoded per cycle
+FORWARD_PAYLOAD_TEMPLATE = (
+    b'{"drone_id":"drone1","avg_temperature":%a,"avg_humidity":%a,"anomalies":%s,'
+    b'"timestamp":"%s","drone_status":%s,"battery_level":%d,"connected_sensors":%s}\n'
+)
+
+def encode_forward_payload(avg_temp, avg_hum, anomalies, status, battery, sensors_json):
+    """Fill the fixed forward payload template with one cycle's values"""
+    return FORWARD_PAYLOAD_TEMPLATE % (
+        avg_temp, avg_hum, encode_json(anomalies),
+        current_timestamps()[2].encode(), encode_json(status), battery,
+        sensors_json
+    )
 
-def send_status_updates(gui_log):
-    """Improved status updates with connection pooling"""
-    retry_delay = 1
-    max_retry_delay = 30
-    
+# Compressed frames start with a zero byte, which never begins a JSON line, then the body length
+COMPRESSED_FRAME_HEADER = struct.Struct(">BI")
+zstd_compressor = zstandard.ZstdCompressor(level=1) if zstandard and COMPRESS_FORWARDS else None
+
+def frame_forward_payload(payload):
+    """Return the buffers to send for a payload, compressing it if large enough to pay off"""
+    if zstd_compressor is None or len(payload) <= COMPRESS_MIN_SIZE:
+        return (payload,)
+    body = zstd_compressor.compress(payload)
+    return (COMPRESSED_FRAME_HEADER.pack(0, len(body)), body)
+
+def run_network_task(coro, loop):
+    """Schedule a coroutine on a network loop from another thread, logging if it dies"""
+    def report(future):
+        if not future.cancelled() and future.exception():
+            logger.error(f"Network task {coro.__name__} failed: {future.exception()}")
+    asyncio.run_coroutine_threadsafe(coro, loop).add_done_callback(report)
+
+async def connect_to_central():
+    """Open a long-lived connection to the central server with TCP keepalive enabled"""
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(CENTRAL_IP, CENTRAL_PORT), timeout=10.0
+    )
+    sock = writer.get_extra_info('socket')
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, CENTRAL_KEEPIDLE)
+    return reader, writer
+
+class CentralConnection:
+    """One connection to the central server shared by the forwarder and status sender"""
+
+    def __init__(self, gui_log):
+        self.gui_log = gui_log
+        self.writer = None
+        self.lost = asyncio.Event()
+
+    @property
+    def connected(self):
+        return self.writer is not None
+
+    async def maintain(self):
+        """Keep the connection open, reconnecting with exponential backoff"""
+        retry_delay = 1
+        max_retry_delay = 30
+        while server_running:
+            try:
+                self.gui_log("Connecting to central server...")
+                _, self.writer = await connect_to_central()
+                self.gui_log("Connected to central server.")
+                retry_delay = 1  # Reset retry delay on successful connection
+                self.lost.clear()
+                await self.lost.wait()
+            except Exception as conn_error:
+                if server_running:
+                    self.gui_log(f"Could not connect to central server: {conn_error}")
+                    await asyncio.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2, max_retry_delay)  # Exponential backoff
+
+    async def send(self, *buffers):
+        """Write one message as a gathered write; a failure drops the connection for maintain()"""
+        writer = self.writer
+        try:
+            writer.writelines(buffers)
+            await writer.drain()
+        except OSError:
+            self.close(writer)
+            raise
+
+    def close(self, writer):
+        if self.writer is writer:
+            writer.close()
+            self.writer = None
+            self.lost.set()
+
+async def send_status_updates(central, gui_log):
+    """Send the drone status every interval; it doubles as the connection heartbeat"""
+    # Sleep to a monotonic deadline so send time doesn't accumulate as drift
+    loop = asyncio.get_running_loop()
+    next_send = loop.time() + FORWARD_INTERVAL
     while server_running:
+        await asyncio.sleep(max(0, next_send - loop.time()))
+        next_send += FORWARD_INTERVAL
+        if not central.connected:
+            continue
+        
         try:
-            gui_log("Connecting to central server for status updates...")
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(10.0)  # Set connection timeout
-            s.connect((CENTRAL_IP, CENTRAL_PORT))
-            gui_log("Connected to central server for status updates.")
-            retry_delay = 1  # Reset retry delay on successful connection
-
-            while server_running:
-                time.sleep(5)  # Send updates every 5 seconds
-                
-                try:
-                    with safe_lock(status_lock):
-                        # Always send only essential data
-                        payload = {
-                            "drone_id": "drone1",
-                            "drone_status": drone_status,
-                            "battery_level": battery_level,
-                            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ")
-                        }
-
-                    s.sendall(json.dumps(payload).encode() + b"\n")
-                    gui_log(f"Status Update: Status={drone_status}, Battery={battery_level}%")
-                    
-                except socket.error as send_error:
-                    gui_log(f"Error sending status update: {send_error}")
-                    break  # Reconnect
-                except Exception as e:
-                    logger.error(f"Unexpected error in status update: {e}")
-                    break
-
-        except Exception as conn_error:
-            if server_running:
-                gui_log(f"Could not connect to central server for status updates: {conn_error}")
-                time.sleep(min(retry_delay, max_retry_delay))
-                retry_delay = min(retry_delay * 2, max_retry_delay)  # Exponential backoff
-
-def forward_to_central(gui_log):
-    """Improved central forwarding with better error handling"""
-    global sensor_data_buffer
-    retry_delay = 1
-    max_retry_delay = 30
-
+            # Always send only essential data
+            state = drone_state
+            payload = {
+                "drone_id": "drone1",
+                "drone_status": state.status,
+                "battery_level": state.battery,
+                "timestamp": current_timestamps()[2]
+            }
+
+            # Body and terminator go out as one gathered write, no concatenation copy
+            await central.send(encode_json(payload), b"\n")
+            gui_log(f"Status Update: Status={payload['drone_status']}, Battery={payload['battery_level']}%")
+            
+        except OSError as send_error:
+            gui_log(f"Error sending status update: {send_error}")
+        except Exception as e:
+            logger.error(f"Unexpected error in status update: {e}")
+
+async def forward_to_central(central, gui_log):
+    """Forward the aggregated sensor readings every interval"""
+    global temp_sum, hum_sum, sample_count, pending_anomalies, connected_sensors_json
+    # Fixed aggregation windows on a monotonic deadline
+    loop = asyncio.get_running_loop()
+    next_send = loop.time() + FORWARD_INTERVAL
     while server_running:
+        await asyncio.sleep(max(0, next_send - loop.time()))
+        next_send += FORWARD_INTERVAL
+        # Leave readings aggregating until the central server is reachable again
+        if not central.connected:
+            continue
+        
         try:
-            gui_log("Connecting to central server for sensor data...")
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(10.0)
-            s.connect((CENTRAL_IP, CENTRAL_PORT))
-            gui_log("Connected to central server for sensor data.")
-            retry_delay = 1  # Reset retry delay
-
-            while server_running:
-                time.sleep(5)
+            state = drone_state  # One consistent snapshot of status and battery
+            if state.returning:
+                continue
+
+            with safe_lock(data_lock):
+                if not sample_count:
+                    continue
+
+                # Take the running aggregates and reset them
+                avg_temp = temp_sum / sample_count
+                avg_hum = hum_sum / sample_count
+                all_anomalies, pending_anomalies = pending_anomalies, deque(maxlen=MAX_PENDING_ANOMALIES)
+                temp_sum = hum_sum = 0.0
+                sample_count = 0
+
+            # Re-encode the sensor list only when a new snapshot was published
+            sensors = connected_sensors_snapshot
+            if connected_sensors_json[0] is not sensors:
+                connected_sensors_json = (sensors, encode_json(list(sensors)))
+            sensors_json = connected_sensors_json[1]
+
+            avg_temp = round(avg_temp, 2)
+            avg_hum = round(avg_hum, 2)
+
+            payload = encode_forward_payload(avg_temp, avg_hum, [fmt % (value, sid) for fmt, value, sid in all_anomalies], state.status, state.battery, sensors_json)
+            await central.send(*frame_forward_payload(payload))
+            gui_log(f"Sensor Data: Avg Temp={avg_temp}°C, Avg Humidity={avg_hum}%")
+            if all_anomalies:
+                gui_log(f"Forwarded anomalies: {len(all_anomalies)}")
                 
-                try:
-                    with safe_lock(data_lock):
-                        if not sensor_data_buffer:
-                            continue
-                            
-                        with safe_lock(status_lock):
-                            if returning_to_base:
-                                continue
-
-                        # Process buffer data
-                        buffer_copy = sensor_data_buffer.copy()
-                        sensor_data_buffer.clear()  # Clear buffer after copying
-                        
-                        if not buffer_copy:
-                            continue
-
-                    # Calculate outside of lock
-                    avg_temp = sum(d["temperature"] for d in buffer_copy) / len(buffer_copy)
-                    avg_hum = sum(d["humidity"] for d in buffer_copy) / len(buffer_copy)
-                    
-                    all_anomalies = []
-                    for data in buffer_copy:
-                        if 'anomalies' in data and data['anomalies']:
-                            all_anomalies.extend(data['anomalies'])
-
-                    with safe_lock(status_lock):
-                        payload = {
-                            "drone_id": "drone1",
-                            "avg_temperature": round(avg_temp, 2),
-                            "avg_humidity": round(avg_hum, 2),
-                            "anomalies": all_anomalies,
-                            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                            "drone_status": drone_status,
-                            "battery_level": battery_level,
-                            "connected_sensors": list(connected_sensors)
-                        }
-
-                    s.sendall(json.dumps(payload).encode() + b"\n")
-                    gui_log(f"Sensor Data: Avg Temp={payload['avg_temperature']}°C, Avg Humidity={payload['avg_humidity']}%")
-                    if all_anomalies:
-                        gui_log(f"Forwarded anomalies: {len(all_anomalies)}")
-                        
-                except socket.error as send_error:
-                    gui_log(f"Error sending sensor data: {send_error}")
-                    break  # Reconnect
-                except Exception as e:
-                    logger.error(f"Unexpected error in data forwarding: {e}")
-                    break
-
-        except Exception as conn_error:
-            if server_running:
-                gui_log(f"Could not connect to central server for sensor data: {conn_error}")
-                time.sleep(min(retry_delay, max_retry_delay))
-                retry_delay = min(retry_delay * 2, max_retry_delay)
+        except OSError as send_error:
+            gui_log(f"Error sending sensor data: {send_error}")
+        except Exception as e:
+            logger.error(f"Unexpected error in data forwarding: {e}")
+
+async def run_central_link(gui_log):
+    """Run the shared central connection together with the two periodic senders"""
+    central = CentralConnection(gui_log)
+    await asyncio.gather(
+        central.maintain(),
+        forward_to_central(central, gui_log),
+        send_status_updates(central, gui_log)
+    )
 
 def simulate_battery(gui_log, battery_var, status_var):
     """Improved battery simulation with thread safety"""
-    global battery_level, drone_status, returning_to_base
+    global drone_state
     
+    next_tick = time.monotonic() + BATTERY_INTERVAL
     while server_running:
-        time.sleep(10)  # Update battery every 10 seconds
+        time.sleep(max(0, next_tick - time.monotonic()))  # Update battery every 10 seconds
+        next_tick += BATTERY_INTERVAL
         
         try:
             with safe_lock(status_lock):
-                if returning_to_base:
+                previous = drone_state
+                status, battery, returning = previous
+                if returning:
                     # Charging
-                    battery_level = min(MAX_BATTERY_LEVEL, battery_level + BATTERY_CHARGE_RATE)
-                    if battery_level >= MAX_BATTERY_LEVEL:
-                        returning_to_base = False
-                        drone_status = "Active"
+                    battery = min(MAX_BATTERY_LEVEL, battery + BATTERY_CHARGE_RATE)
+                    if battery >= MAX_BATTERY_LEVEL:
+                        returning = False
+                        status = "Active"
                         gui_log("Battery fully charged. Drone is now active.")
                 else:
                     # Discharging
-                    battery_level = max(0, battery_level - BATTERY_DRAIN_RATE)
-                    if battery_level <= BATTERY_THRESHOLD:
-                        returning_to_base = True
-                        drone_status = "Returning to Base"
-                        gui_log(f"Battery level ({battery_level}%) below threshold. Returning to base.")
+                    battery = max(0, battery - BATTERY_DRAIN_RATE)
+                    if battery <= BATTERY_THRESHOLD:
+                        returning = True
+                        status = "Returning to Base"
+                        gui_log(f"Battery level ({battery}%) below threshold. Returning to base.")
+                drone_state = DroneState(status, battery, returning)
             
-            # Update GUI in main thread
-            gui_update_queue.put(('battery', battery_level))
-            gui_update_queue.put(('status', drone_status))
+            # Update GUI in main thread, only for values that changed. Compared with the
+            # previous state rather than the last value queued, since the manual controls
+            # also write drone_state and the GUI variables
+            if battery != previous.battery:
+                gui_update_queue.put(('battery', battery))
+            if status != previous.status:
+                gui_update_queue.put(('status', status))
             
         except Exception as e:
             logger.error(f"Error in battery simulation: {e}")
 
+def build_chart_frame():
+    """Snapshot the chart histories and pick the tick labels for one frame"""
+    with safe_lock(chart_lock):
+        head = temperature_history.head
+        # Copies, since the consumer keeps writing into the ring buffers
+        temp_data = temperature_history.view().copy()
+        hum_data = humidity_history.view().copy()
+        # Select a few timestamps for labels to avoid overcrowding; only
+        # those few strings are read, not a copy of the whole history
+        count = len(timestamps)
+        label_indices, label_timestamps = [], []
+        if count > 1:
+            label_indices = np.linspace(0, count - 1, min(5, count)).astype(np.intp).tolist()
+            label_timestamps = [timestamps[i] for i in label_indices]
+    
+    # Both histories share one length
+    n = min(len(temp_data), len(hum_data))
+    time_labels = [format_time_label(ts) or "--:--:--" for ts in label_timestamps]
+    return (head, temp_data[-n:], hum_data[-n:], label_indices, time_labels)
+
+def prepare_chart_frames():
+    """Publish chart frames off the Tk thread whenever new readings have arrived"""
+    global chart_frame
+    next_tick = time.monotonic()
+    while server_running:
+        try:
+            # Without new readings the published frame is kept, so the GUI can skip its redraw
+            frame = chart_frame
+            if frame is None or frame[0] != temperature_history.head:
+                # Publishing one tuple lets the Tk thread read it without a lock
+                chart_frame = build_chart_frame()
+        except Exception as e:
+            logger.error(f"Error preparing chart data: {e}")
+        
+        next_tick += CHART_INTERVAL
+        time.sleep(max(0, next_tick - time.monotonic()))
+
 def start_gui():
-    global server_running
+    global server_running, event_loop, sensor_loops
     
     root = tk.Tk()
     root.title("Drone Edge Server")
@@ -390,8 +669,9 @@ def start_gui():
     def on_closing():
         global server_running
         server_running = False
-        if server_socket:
-            server_socket.close()
+        for loop in [event_loop, *sensor_loops]:
+            if loop:
+                loop.call_soon_threadsafe(loop.stop)
         root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -409,7 +689,7 @@ def start_gui():
     status_frame.pack(fill=tk.X, padx=5, pady=5)
     
     # Battery level
-    battery_var = tk.IntVar(value=battery_level)
+    battery_var = tk.IntVar(value=drone_state.battery)
     ttk.Label(status_frame, text="Battery Level:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
     battery_progress = ttk.Progressbar(status_frame, variable=battery_var, maximum=MAX_BATTERY_LEVEL, length=200)
     battery_progress.grid(row=0, column=1, padx=5, pady=5)
@@ -418,7 +698,7 @@ def start_gui():
     ttk.Label(status_frame, text="%").grid(row=0, column=3, padx=0, pady=5, sticky=tk.W)
     
     # Drone status
-    status_var = tk.StringVar(value=drone_status)
+    status_var = tk.StringVar(value=drone_state.status)
     ttk.Label(status_frame, text="Status:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
     status_label = ttk.Label(status_frame, textvariable=status_var)
     status_label.grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
@@ -431,8 +711,8 @@ def start_gui():
     sensors_text.pack(fill=tk.X, padx=5, pady=5)
     
     # Create chart frame
-    chart_frame = ttk.LabelFrame(dashboard_frame, text="Real-time Data")
-    chart_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+    chart_container = ttk.LabelFrame(dashboard_frame, text="Real-time Data")
+    chart_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
     
     # Create matplotlib figure with improved spacing
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(9, 5), gridspec_kw={'hspace': 0.5})
@@ -442,22 +722,47 @@ def start_gui():
     ax1.set_ylim(0, 40)
     ax1.grid(True, linestyle='--', alpha=0.7)
     ax1.set_ylabel('Temperature (°C)', fontsize=10)
-    temp_line, = ax1.plot([], [], 'r-', linewidth=2)
+    temp_line, = ax1.plot([], [], 'r-', linewidth=2, animated=True)
 
     # Humidity axis with proper configuration
     ax2.set_title('Humidity (%)', fontsize=11, pad=10)
     ax2.set_ylim(0, 100)
     ax2.grid(True, linestyle='--', alpha=0.7)
     ax2.set_ylabel('Humidity (%)', fontsize=10)
-    hum_line, = ax2.plot([], [], 'b-', linewidth=2)
+    hum_line, = ax2.plot([], [], 'b-', linewidth=2, animated=True)
+    
+    # Current values are animated text inside the axes, so they blit with the lines
+    temp_value = ax1.text(0.99, 0.95, '', transform=ax1.transAxes, ha='right', va='top', fontsize=10, animated=True)
+    hum_value = ax2.text(0.99, 0.95, '', transform=ax2.transAxes, ha='right', va='top', fontsize=10, animated=True)
 
     # Apply tight layout with additional padding
     fig.tight_layout(pad=3.0)
 
     # Add figure to tkinter window
-    canvas = FigureCanvasTkAgg(fig, master=chart_frame)
+    canvas = FigureCanvasTkAgg(fig, master=chart_container)
     canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
     
+    # Blitting: the lines are animated artists drawn over cached axes backgrounds.
+    # Every full draw (including window resizes) refreshes the cached backgrounds.
+    chart_backgrounds = {}
+    
+    chart_artists = ((ax1, temp_line, temp_value), (ax2, hum_line, hum_value))
+    
+    def on_canvas_draw(event):
+        for ax, line, value in chart_artists:
+            chart_backgrounds[ax] = canvas.copy_from_bbox(ax.bbox)
+            ax.draw_artist(line)
+            ax.draw_artist(value)
+    
+    canvas.mpl_connect('draw_event', on_canvas_draw)
+    
+    def blit_lines():
+        for ax, line, value in chart_artists:
+            canvas.restore_region(chart_backgrounds[ax])
+            ax.draw_artist(line)
+            ax.draw_artist(value)
+            canvas.blit(ax.bbox)
+    
     # Log tab
     log_frame = ttk.Frame(notebook)
     notebook.add(log_frame, text="Logs")
@@ -478,12 +783,12 @@ def start_gui():
     battery_control_frame.pack(fill=tk.X, padx=5, pady=5)
     
     def set_battery_level():
-        global battery_level
+        global drone_state
         try:
             new_level = int(battery_entry.get())
             if 0 <= new_level <= 100:
                 with safe_lock(status_lock):
-                    battery_level = new_level
+                    drone_state = drone_state._replace(battery=new_level)
                     battery_var.set(new_level)
                 gui_log(f"Battery level manually set to {new_level}%")
             else:
@@ -494,127 +799,172 @@ def start_gui():
     ttk.Label(battery_control_frame, text="Set Battery Level (0-100%):").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
     battery_entry = ttk.Entry(battery_control_frame, width=10)
     battery_entry.grid(row=0, column=1, padx=5, pady=5)
-    battery_entry.insert(0, str(battery_level))
+    battery_entry.insert(0, str(drone_state.battery))
     ttk.Button(battery_control_frame, text="Set", command=set_battery_level).grid(row=0, column=2, padx=5, pady=5)
     
     # Force return to base
     def force_return():
-        global returning_to_base, drone_status
+        global drone_state
         with safe_lock(status_lock):
-            returning_to_base = True
-            drone_status = "Returning to Base"
-            status_var.set(drone_status)
+            drone_state = drone_state._replace(status="Returning to Base", returning=True)
+            status_var.set(drone_state.status)
         gui_log("Manually triggered return to base")
     
     ttk.Button(battery_control_frame, text="Force Return to Base", command=force_return).grid(row=1, column=0, columnspan=3, padx=5, pady=5)
     
     # Resume normal operation
     def resume_operation():
-        global returning_to_base, drone_status
+        global drone_state
         with safe_lock(status_lock):
-            returning_to_base = False
-            drone_status = "Active"
-            status_var.set(drone_status)
+            drone_state = drone_state._replace(status="Active", returning=False)
+            status_var.set(drone_state.status)
         gui_log("Manually resumed normal operation")
     
     ttk.Button(battery_control_frame, text="Resume Normal Operation", command=resume_operation).grid(row=2, column=0, columnspan=3, padx=5, pady=5)
     
     # Define log function with queue
-    def gui_log(message):
-        log_queue.put(message)
+    def gui_log(message, *args, level=logging.INFO):
+        # Filtered messages cost one comparison; %-args are formatted only when drained
+        if level < GUI_LOG_LEVEL:
+            return
+        log_queue.append((current_timestamps()[1], message, args))
     
     # Process log queue
     def process_log_queue():
+        lines = []
         try:
-            while True:
-                message = log_queue.get_nowait()
-                timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-                log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-                log_text.see(tk.END)
-                log_buffer.append(f"[{timestamp}] {message}")
-        except queue.Empty:
-            pass
+            while log_queue and len(lines) < LOG_DRAIN_BATCH:
+                timestamp, message, args = log_queue.popleft()
+                lines.append(f"[{timestamp}] {message % args if args else message}")
         finally:
+            # One insert and one scroll per batch instead of per message
+            if lines:
+                log_buffer.extend(lines)
+                log_text.insert(tk.END, "\n".join(lines) + "\n")
+                # Keep the widget at LOG_BUFFER_SIZE lines so inserts don't slow down over time
+                log_text.delete("1.0", f"end-{LOG_BUFFER_SIZE + 1}l")
+                log_text.see(tk.END)
             root.after(100, process_log_queue)  # Check queue every 100ms
     
     # Process GUI updates
     def process_gui_updates():
+        latest = {}
         try:
+            # Only the newest value of each kind matters; older queued ones are stale
             while True:
                 update_type, value = gui_update_queue.get_nowait()
-                if update_type == 'battery':
-                    battery_var.set(value)
-                elif update_type == 'status':
-                    status_var.set(value)
+                latest[update_type] = value
         except queue.Empty:
             pass
         finally:
+            if 'battery' in latest:
+                battery_var.set(latest['battery'])
+            if 'status' in latest:
+                status_var.set(latest['status'])
             root.after(200, process_gui_updates)  # Check queue every 200ms
     
+    # Shared x positions; once the histories are full the x data never changes
+    x_positions = np.arange(DATA_BUFFER_SIZE)
+    last_len = 0
+    last_sensors = None
+    last_frame = None
+    
+    # Axis decorations last drawn, so unchanged ones don't force a full redraw
+    last_xlim = None
+    last_labels = None
+    last_tick_bucket = None
+    
     # Function to update the charts (optimized)
     def update_charts():
+        nonlocal last_len, last_sensors, last_frame, last_xlim, last_labels, last_tick_bucket
         if not server_running:
             return
             
         try:
-            with safe_lock(data_lock):
-                if len(temperature_history) > 0 and len(humidity_history) > 0:
-                    # Get the data from the deques
-                    temp_data = list(temperature_history)
-                    hum_data = list(humidity_history)
-                    
-                    # Create x-axis data points (indices)
-                    x_data = list(range(len(temp_data)))
-                    
-                    # Update the plot data
-                    temp_line.set_xdata(x_data)
-                    temp_line.set_ydata(temp_data)
-                    hum_line.set_xdata(x_data)
-                    hum_line.set_ydata(hum_data)
-                    
-                    # Adjust the plot limits
-                    if len(x_data) > 1:
-                        ax1.set_xlim(0, len(x_data) - 1)
-                        ax2.set_xlim(0, len(x_data) - 1)
-                        
-                        # Set real-time labels on x-axis
-                        if len(timestamps) > 0:
-                            # Select a few timestamps for labels to avoid overcrowding
-                            num_labels = min(5, len(timestamps))
-                            if num_labels > 1:
-                                label_indices = [int(i * (len(timestamps) - 1) / (num_labels - 1)) for i in range(num_labels)]
-                                time_labels = [timestamps[i].strftime("%H:%M:%S") for i in label_indices]
-                                
-                                ax1.set_xticks(label_indices)
-                                ax1.set_xticklabels(time_labels, rotation=45, fontsize=8)
-                                ax2.set_xticks(label_indices)
-                                ax2.set_xticklabels(time_labels, rotation=45, fontsize=8)
-                    
-                    # Update titles with current values
-                    if temp_data:
-                        ax1.set_title(f'Temperature: {temp_data[-1]:.1f}°C', fontsize=11)
-                    if hum_data:
-                        ax2.set_title(f'Humidity: {hum_data[-1]:.1f}%', fontsize=11)
+            # Frames are prepared by prepare_chart_frames; only artist updates happen here
+            frame = chart_frame
+            sensors = connected_sensors_snapshot  # Published tuple, read without the lock
+
+            # Nothing new since the last redraw (e.g. idle or recharging drone): skip all work
+            if frame is last_frame and sensors is last_sensors:
+                return
+
+            if frame is not None and len(frame[1]) > 0:
+                head, temp_data, hum_data, label_indices, time_labels = frame
+                tick_bucket = head // TICK_UPDATE_INTERVAL
+                chart_dirty = False
+                
+                # x data only changes while the histories fill up
+                n = len(temp_data)
+                if n != last_len:
+                    temp_line.set_xdata(x_positions[:n])
+                    hum_line.set_xdata(x_positions[:n])
+                    last_len = n
+                temp_line.set_ydata(temp_data)
+                hum_line.set_ydata(hum_data)
+                
+                # Adjust the plot limits
+                if n > 1:
+                    xlim = (0, n - 1)
+                    if xlim != last_xlim:
+                        ax1.set_xlim(*xlim)
+                        ax2.set_xlim(*xlim)
+                        last_xlim = xlim
+                        chart_dirty = True
                     
-                    # Update connected sensors text
+                    # Set real-time labels on x-axis, refreshed every few readings
+                    if label_indices and (chart_dirty or tick_bucket != last_tick_bucket):
+                        last_tick_bucket = tick_bucket
+                        if (label_indices, time_labels) != last_labels:
+                            ax1.set_xticks(label_indices)
+                            ax1.set_xticklabels(time_labels, rotation=45, fontsize=8)
+                            ax2.set_xticks(label_indices)
+                            ax2.set_xticklabels(time_labels, rotation=45, fontsize=8)
+                            last_labels = (label_indices, time_labels)
+                            chart_dirty = True
+                
+                # Current values are blitted with the lines, no full redraw needed
+                temp_value.set_text(f'{temp_data[-1]:.1f}°C')
+                hum_value.set_text(f'{hum_data[-1]:.1f}%')
+                
+                # Update connected sensors text when a new snapshot was published
+                if sensors is not last_sensors:
                     sensors_text.delete(1.0, tk.END)
-                    if connected_sensors:
-                        sensors_text.insert(tk.END, f"Connected sensors ({len(connected_sensors)}): {', '.join(connected_sensors)}")
+                    if sensors:
+                        sensors_text.insert(tk.END, f"Connected sensors ({len(sensors)}): {', '.join(sensors)}")
                     else:
                         sensors_text.insert(tk.END, "No sensors connected")
-                    
-                    # Force a redraw of the canvas
-                    canvas.draw_idle()
+                    last_sensors = sensors
+                
+                # Full redraw only when the axes changed, otherwise just blit the animated artists
+                if chart_dirty or not chart_backgrounds:
+                    canvas.draw()
+                else:
+                    blit_lines()
+            # Only a frame that rendered counts as drawn, so a failed one is retried next tick
+            last_frame = frame
         except Exception as e:
             logger.error(f"Error updating charts: {e}")
         finally:
             # Schedule the next update
-            root.after(2000, update_charts)  # Update every 2 seconds instead of 1
-    
-    # Start server threads
-    threading.Thread(target=start_sensor_server, args=(gui_log,), daemon=True).start()
-    threading.Thread(target=forward_to_central, args=(gui_log,), daemon=True).start()
-    threading.Thread(target=send_status_updates, args=(gui_log,), daemon=True).start()
+            root.after(int(CHART_INTERVAL * 1000), update_charts)
+    
+    # Run the network tasks on one asyncio loop in a background thread
+    event_loop = asyncio.new_event_loop()
+    threading.Thread(target=event_loop.run_forever, daemon=True).start()
+    
+    # With SO_REUSEPORT the kernel spreads incoming sensors over several listeners,
+    # each accepting on its own loop and thread
+    reuse_port = hasattr(socket, "SO_REUSEPORT") and SENSOR_LISTENERS > 1
+    if reuse_port:
+        sensor_loops = [asyncio.new_event_loop() for _ in range(SENSOR_LISTENERS - 1)]
+        for loop in sensor_loops:
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+    for loop in [event_loop, *sensor_loops]:
+        run_network_task(start_sensor_server(gui_log, reuse_port), loop)
+    run_network_task(run_central_link(gui_log), event_loop)
+    threading.Thread(target=consume_sensor_data, args=(gui_log,), daemon=True).start()
+    threading.Thread(target=prepare_chart_frames, daemon=True).start()
     threading.Thread(target=simulate_battery, args=(gui_log, battery_var, status_var), daemon=True).start()
     
     # Initial log
@@ -623,7 +973,7 @@ def start_gui():
     # Start the update loops
     root.after(100, process_log_queue)
     root.after(200, process_gui_updates)
-    root.after(2000, update_charts)
+    root.after(int(CHART_INTERVAL * 1000), update_charts)
     
     # Start the main loop
     root.mainloop()
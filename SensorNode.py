@@ -1,45 +1,93 @@
 # SensorNode.py
+import asyncio
 import socket
-import time
 import json
 import argparse
 import random
-from datetime import datetime
+import time
 import sys
+import numpy as np
+
+RECONNECT_BASE_DELAY = 1.0  # Seconds before the first reconnect attempt
+RECONNECT_MAX_DELAY = 60.0  # Upper bound for the exponential reconnect backoff
+RECONNECT_JITTER = 0.2  # Up to this fraction of the delay is added at random
+READING_BATCH_SIZE = 4096  # Normal readings generated per NumPy batch
+KEEPALIVE_IDLE = 30  # Seconds of idle time before TCP keepalive probes start
+SEND_BACKLOG_LIMIT = 16384  # Unsent bytes above which new readings are dropped (below asyncio's 64 KiB high-water mark)
+DROP_REPORT_INTERVAL = 100  # Print one backlog warning per this many dropped readings
+
+class NormalReadings:
+    """
+    Normal-range (temperature, humidity) pairs generated in NumPy batches and handed out one at a time
+    """
+    
+    def __init__(self, batch_size=READING_BATCH_SIZE):
+        self.rng = np.random.default_rng()
+        self.batch_size = batch_size
+        self.pairs = []
+        self.index = 0
+    
+    def next(self):
+        if self.index == len(self.pairs):
+            temps = np.round(self.rng.uniform(20, 30, self.batch_size), 2)
+            hums = np.round(self.rng.uniform(40, 60, self.batch_size), 2)
+            # Python floats, so the record template formats them like round() results
+            self.pairs = list(zip(temps.tolist(), hums.tolist()))
+            self.index = 0
+        pair = self.pairs[self.index]
+        self.index += 1
+        return pair
+
+# Shared by every sensor on the event loop; all of them run on one thread
+normal_readings = NormalReadings()
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS" in UTC), so strftime runs at most once per second
+timestamp_cache = (None, "")
+
+def utc_timestamp():
+    """
+    Return the current UTC time as an ISO 8601 string with microseconds and a Z suffix
+    """
+    global timestamp_cache
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = timestamp_cache
+    if cached_second != seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        timestamp_cache = (seconds, prefix)
+    return f"{prefix}.{micros:06d}Z"
 
 def generate_sensor_data(sensor_id, with_anomaly=False, anomaly_type=None):
     """
     Generate simulated sensor data with optional anomalies
     """
-    # Normal ranges
-    if not with_anomaly or anomaly_type != "temperature":
-        temperature = round(random.uniform(20, 30), 2)
-    else:
-        # Generate temperature anomaly (outside normal range)
-        temperature = round(random.choice([
-            random.uniform(0, 15),  # Too cold
-            random.uniform(36, 50)  # Too hot
-        ]), 2)
-    
-    if not with_anomaly or anomaly_type != "humidity":
-        humidity = round(random.uniform(40, 60), 2)
-    else:
-        # Generate humidity anomaly (outside normal range)
-        humidity = round(random.choice([
-            random.uniform(0, 25),  # Too dry
-            random.uniform(75, 100)  # Too humid
-        ]), 2)
+    # Normal ranges come from the pre-generated batch; most readings need nothing else
+    temperature, humidity = normal_readings.next()
+    if with_anomaly:
+        # Replace one value with an anomaly (outside normal range), drawing only the side used
+        if anomaly_type == "temperature":
+            # Too cold or too hot
+            temperature = round(random.uniform(0, 15) if random.getrandbits(1) else random.uniform(36, 50), 2)
+        elif anomaly_type == "humidity":
+            # Too dry or too humid
+            humidity = round(random.uniform(0, 25) if random.getrandbits(1) else random.uniform(75, 100), 2)
     
     return {
         "sensor_id": sensor_id,
         "temperature": temperature,
         "humidity": humidity,
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "timestamp": utc_timestamp()
     }
 
-def main(drone_ip, drone_port, sensor_id, interval, anomaly_frequency):
+def make_record_template(sensor_id):
     """
-    Main function to connect to drone and send sensor data
+    Build the fixed JSON record layout for one sensor; only the readings are filled in per send
+    """
+    sensor_json = json.dumps(sensor_id).replace("%", "%%")
+    return '{"sensor_id":' + sensor_json + ',"temperature":%r,"humidity":%r,"timestamp":"%s"}\n'
+
+async def run_sensor(drone_ip, drone_port, sensor_id, interval, anomaly_frequency, verbose=True):
+    """
+    Connect one simulated sensor to the drone and send its readings, reconnecting on failure
     
     Parameters:
     drone_ip (str): IP address of the drone
@@ -47,9 +95,14 @@ def main(drone_ip, drone_port, sensor_id, interval, anomaly_frequency):
     sensor_id (str): Unique identifier for this sensor
     interval (int): Time interval between data transmissions in seconds
     anomaly_frequency (int): 1 in X chance to generate anomalous data
+    verbose (bool): Print a line for every reading sent
     """
     connection_attempts = 0
     data_sent_count = 0
+    dropped_count = 0
+    retry_delay = RECONNECT_BASE_DELAY
+    record_template = make_record_template(sensor_id)
+    anomaly_probability = 1.0 / anomaly_frequency
     
     print(f"[{sensor_id}] Starting sensor node...")
     print(f"[{sensor_id}] Configured to connect to Drone at {drone_ip}:{drone_port}")
@@ -57,46 +110,90 @@ def main(drone_ip, drone_port, sensor_id, interval, anomaly_frequency):
     print(f"[{sensor_id}] Anomaly frequency: 1 in {anomaly_frequency} chance")
     
     while True:
+        writer = None
         try:
             connection_attempts += 1
             print(f"[{sensor_id}] Connection attempt #{connection_attempts} to Drone at {drone_ip}:{drone_port}")
             
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.connect((drone_ip, drone_port))
-                print(f"[{sensor_id}] Connected to Drone at {drone_ip}:{drone_port}")
-                
-                # Reset connection attempts counter on successful connection
-                connection_attempts = 0
-                
-                while True:
+            _, writer = await asyncio.open_connection(drone_ip, drone_port)
+            sock = writer.get_extra_info('socket')
+            # Each reading is one small self-contained record; send it without Nagle delay
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Keepalive notices a drone that vanished without closing the connection
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+            print(f"[{sensor_id}] Connected to Drone at {drone_ip}:{drone_port}")
+            
+            # Sleep to absolute deadlines so send and print time don't accumulate as drift
+            loop = asyncio.get_running_loop()
+            connected_at = next_send = loop.time()
+            while True:
+                # A drone that stops reading must not stall the schedule: while too much is
+                # still unsent, drop this reading instead of waiting in drain()
+                if writer.transport.get_write_buffer_size() > SEND_BACKLOG_LIMIT:
+                    dropped_count += 1
+                    # Report the first drop and then every so often, not once per reading
+                    if dropped_count % DROP_REPORT_INTERVAL == 1:
+                        print(f"[{sensor_id}] Drone is not keeping up; dropped reading ({dropped_count} so far)")
+                else:
                     # Decide if we should generate an anomaly
-                    generate_anomaly = random.randint(1, anomaly_frequency) == 1
-                    anomaly_type = random.choice(["temperature", "humidity"]) if generate_anomaly else None
+                    generate_anomaly = random.random() < anomaly_probability
+                    anomaly_type = ("temperature" if random.getrandbits(1) else "humidity") if generate_anomaly else None
                     
                     # Generate and send data
                     data = generate_sensor_data(sensor_id, generate_anomaly, anomaly_type)
-                    s.sendall(json.dumps(data).encode())
+                    # One contiguous newline-framed record per write, values filled into the template
+                    record = (record_template % (data["temperature"], data["humidity"], data["timestamp"])).encode()
+                    writer.write(record)
+                    # Returns at once below the transport's high-water mark; raises if the connection is gone
+                    await writer.drain()
                     
-                    data_sent_count += 1
-                    anomaly_msg = f" (ANOMALY: {anomaly_type})" if generate_anomaly else ""
-                    print(f"[{sensor_id}] #{data_sent_count} Sent: Temp={data['temperature']}°C, Humidity={data['humidity']}%{anomaly_msg}")
+                    # A drone returning to base accepts and then closes at once, so only a
+                    # connection that has stayed up for an interval resets the backoff
+                    if connection_attempts and loop.time() - connected_at >= interval:
+                        connection_attempts = 0
+                        retry_delay = RECONNECT_BASE_DELAY
                     
-                    time.sleep(interval)
+                    data_sent_count += 1
+                    if verbose:
+                        anomaly_msg = f" (ANOMALY: {anomaly_type})" if generate_anomaly else ""
+                        print(f"[{sensor_id}] #{data_sent_count} Sent: Temp={data['temperature']}°C, Humidity={data['humidity']}%{anomaly_msg}")
                     
+                next_send += interval
+                await asyncio.sleep(max(0, next_send - loop.time()))
+                
         except ConnectionRefusedError:
             print(f"[{sensor_id}] Connection refused. Drone not available at {drone_ip}:{drone_port}")
-            print(f"[{sensor_id}] Retrying in 5 seconds...")
-            time.sleep(5)
             
         except ConnectionResetError:
             print(f"[{sensor_id}] Connection reset by drone. Likely drone is returning to base.")
-            print(f"[{sensor_id}] Retrying in 5 seconds...")
-            time.sleep(5)
             
         except Exception as e:
             print(f"[{sensor_id}] Connection failed: {e}")
-            print(f"[{sensor_id}] Retrying in 5 seconds...")
-            time.sleep(5)
+        
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        # Exponential backoff with jitter so sensors don't all reconnect at the same moment
+        delay = retry_delay + random.uniform(0, retry_delay * RECONNECT_JITTER)
+        print(f"[{sensor_id}] Retrying in {delay:.1f} seconds...")
+        await asyncio.sleep(delay)
+        retry_delay = min(retry_delay * 2, RECONNECT_MAX_DELAY)
+
+async def main(drone_ip, drone_port, sensor_id, interval, anomaly_frequency, count=1, verbose=True):
+    """
+    Run one or more simulated sensors concurrently on a single event loop
+    
+    Parameters:
+    count (int): Number of sensors to simulate; with more than one, IDs are sensor_id_1..sensor_id_N
+    (remaining parameters as for run_sensor)
+    """
+    sensor_ids = [sensor_id] if count == 1 else [f"{sensor_id}_{i}" for i in range(1, count + 1)]
+    await asyncio.gather(*(
+        run_sensor(drone_ip, drone_port, sid, interval, anomaly_frequency, verbose) for sid in sensor_ids
+    ))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Environmental Sensor Node Simulator")
@@ -105,11 +202,13 @@ if __name__ == "__main__":
     parser.add_argument("--sensor_id", default="sensor1", help="Unique identifier for this sensor")
     parser.add_argument("--interval", type=int, default=5, help="Data transmission interval in seconds")
     parser.add_argument("--anomaly_frequency", type=int, default=20, help="1 in X chance to generate anomalous data")
+    parser.add_argument("--count", type=int, default=1, help="Number of sensors to simulate in this process")
+    parser.add_argument("--quiet", action="store_true", help="Don't print a line for every reading sent")
     
     args = parser.parse_args()
     
     try:
-        main(args.drone_ip, args.drone_port, args.sensor_id, args.interval, args.anomaly_frequency)
+        asyncio.run(main(args.drone_ip, args.drone_port, args.sensor_id, args.interval, args.anomaly_frequency, args.count, not args.quiet))
     except KeyboardInterrupt:
         print(f"\n[{args.sensor_id}] Sensor node stopped by user")
-        sys.exit(0)
\ No newline at end of file
+        sys.exit(0)